@@ -0,0 +1,81 @@
+"""Compare fresh-connection fetches against the pooled HTTP client on a local server.
+
+Run from the backend directory:
+    python -m benchmarks.http_pool_benchmark [num_requests]
+
+The server counts accepted TCP connections, so the output shows how many
+handshakes each strategy needed as well as the wall-clock time.
+"""
+import sys
+import threading
+import time
+import requests
+from flask import Config as FlaskConfig
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config import Config
+from web_search.http_client import PooledHttpClient
+
+PAGE = b'<html><head><title>Bench</title></head><body>' + b'<p>lorem ipsum</p>' * 200 + b'</body></html>'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Needed for keep-alive
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused sockets
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+def _run(server, fetch, num_requests):
+    server.connections = 0
+    start = time.perf_counter()
+    for _ in range(num_requests):
+        fetch().raise_for_status()
+    return time.perf_counter() - start, server.connections
+
+
+def main(num_requests=200):
+    server = _CountingServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/article'
+
+    config = FlaskConfig('.')
+    config.from_object(Config)
+    client = PooledHttpClient(config)
+
+    try:
+        # Old newspaper path: every download opened its own connection
+        fresh_time, fresh_conns = _run(server, lambda: requests.get(url, timeout=Config.REQUEST_TIMEOUT), num_requests)
+        pooled_time, pooled_conns = _run(server, lambda: client.get(url), num_requests)
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    print(f"{'strategy':<10}{'requests':>10}{'connections':>14}{'seconds':>10}{'req/s':>10}")
+    for name, elapsed, conns in (('fresh', fresh_time, fresh_conns), ('pooled', pooled_time, pooled_conns)):
+        print(f"{name:<10}{num_requests:>10}{conns:>14}{elapsed:>10.3f}{num_requests / elapsed:>10.1f}")
+    print(f"Speedup: {fresh_time / pooled_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
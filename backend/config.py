@@ -32,4 +32,24 @@ class Config:
     # Web Scraping Settings
     REQUEST_TIMEOUT = 10
     MAX_CONTENT_LENGTH = 50000  # Max characters to extract per page
-    SKIP_DOMAINS = ['facebook.com', 'twitter.com', 'instagram.com', 'youtube.com']
\ No newline at end of file
+    SKIP_DOMAINS = ['facebook.com', 'twitter.com', 'instagram.com', 'youtube.com']
+    
+    # HTTP Connection Pool Settings
+    HTTP_POOL_CONNECTIONS = 20  # Number of per-host connection pools to keep
+    HTTP_POOL_MAXSIZE = 4  # Keep-alive connections kept per host
+    HTTP_CONNECT_TIMEOUT = 3  # Seconds to establish a connection; REQUEST_TIMEOUT is the read timeout
+    HTTP_MAX_RETRIES = 2  # Total retries per request hop (connect failures are cheap to retry)
+    HTTP_MAX_READ_RETRIES = 0  # Retries after a read timeout or a connection dropped mid-response
+    HTTP_MAX_STATUS_RETRIES = 0  # Retries after a 429/5xx response
+    # A keep-alive socket closed by the server before it answers is always resent once,
+    # independent of the limits above, so pooling races don't fail a fetch or trip the breaker
+    HTTP_BACKOFF_FACTOR = 0.5  # Exponential backoff base in seconds
+    HTTP_BACKOFF_JITTER = 0.5  # Max random seconds added to each backoff
+    HTTP_MAX_REDIRECTS = 5
+    # Worst case per redirect hop with these defaults: two connect timeouts, then one full
+    # attempt, plus backoff (0s, then 1s + up to 0.5s jitter): 3 + 3 + (3 + 10) + 1.5 = 20.5s.
+    # A dropped keep-alive resend can double a hop to 41s, and every hop gets a fresh budget,
+    # so a URL with HTTP_MAX_REDIRECTS redirects can take up to 6 x 41 = 246s. REQUEST_TIMEOUT
+    # limits each socket read, not the whole download, so a server trickling bytes can take longer.
+    HTTP_CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failures before a host is skipped
+    HTTP_CIRCUIT_COOLDOWN = 300  # Seconds a failing host stays skipped
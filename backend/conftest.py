@@ -0,0 +1,20 @@
+import os
+import sys
+import pytest
+from flask import Config as FlaskConfig
+
+# Import backend packages (config, web_search, ...) the same way app.py does,
+# whatever pytest's import mode
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from config import Config
+
+
+@pytest.fixture
+def config():
+    """Fresh app configuration, loaded like app.py; tests may override values"""
+    app_config = FlaskConfig(BACKEND_DIR)
+    app_config.from_object(Config)
+    return app_config
@@ -0,0 +1,126 @@
+import sys
+import types
+import pytest
+import requests
+
+pytest.importorskip('bs4')
+pytest.importorskip('tldextract')
+try:
+    import newspaper  # noqa: F401
+except ImportError:
+    # Article is replaced per test below, so a placeholder module is enough to import the extractor
+    sys.modules['newspaper'] = types.SimpleNamespace(Article=None)
+
+from web_search import content_extractor
+from web_search.content_extractor import WebContentExtractor
+
+URL = 'http://news.example.com/story'
+BODY = 'Le café était plein. ' * 20
+PAGE = (
+    '<html><head><meta charset="utf-8"><title>Café story</title></head>'
+    f'<body><nav>Menu</nav><p>{BODY}</p><script>var x = 1;</script></body></html>'
+).encode('utf-8')
+
+
+class FakeHttp:
+    """Stands in for PooledHttpClient, serving one canned page"""
+
+    def __init__(self, status=200, content=PAGE, open_circuit=False, error=None):
+        self.status = status
+        self.content = content
+        self.open_circuit = open_circuit
+        self.error = error
+        self.requested = []
+
+    def is_open(self, url):
+        return self.open_circuit
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        if self.error:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = url
+        # Served without a charset, so response.text would fall back to ISO-8859-1
+        response.headers['Content-Type'] = 'text/html'
+        response._content = self.content
+        return response
+
+
+class FakeArticle:
+    """Records the HTML newspaper would have parsed and returns canned results"""
+
+    instances = []
+    text = ''
+
+    def __init__(self, url):
+        self.url = url
+        self.title = 'Newspaper title'
+        self.authors = ['A. Writer']
+        self.publish_date = None
+        FakeArticle.instances.append(self)
+
+    def download(self, input_html=None):
+        if input_html is None:
+            raise AssertionError('Article must not fetch the page itself')
+        self.input_html = input_html
+
+    def parse(self):
+        self.text = type(self).text
+
+
+@pytest.fixture
+def extractor(config, monkeypatch):
+    FakeArticle.instances = []
+    FakeArticle.text = ''
+    monkeypatch.setattr(content_extractor, 'Article', FakeArticle)
+    extractor = WebContentExtractor(config)
+    extractor.http = FakeHttp()
+    return extractor
+
+
+def test_newspaper_parses_the_pooled_response_bytes(extractor):
+    FakeArticle.text = BODY
+
+    result = extractor.extract_content(URL)
+
+    assert result['extraction_method'] == 'newspaper'
+    assert result['text'] == BODY
+    assert result['domain'] == 'example.com'
+    assert extractor.http.requested == [URL]
+    # Raw bytes, so newspaper decodes via the <meta> charset rather than ISO-8859-1
+    assert FakeArticle.instances[0].input_html == PAGE
+
+
+def test_fallback_reuses_the_same_response(extractor):
+    FakeArticle.text = 'too short'
+
+    result = extractor.extract_content(URL)
+
+    assert result['extraction_method'] == 'beautifulsoup'
+    assert extractor.http.requested == [URL]
+    assert result['title'] == 'Café story'
+    assert 'Le café était plein.' in result['text']
+    assert 'Menu' not in result['text'] and 'var x' not in result['text']
+
+
+def test_open_circuit_skips_fetch(extractor, capsys):
+    extractor.http = FakeHttp(open_circuit=True)
+
+    assert extractor.extract_content(URL) is None
+    assert extractor.http.requested == []
+    assert FakeArticle.instances == []
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('http', [
+    FakeHttp(status=404),
+    FakeHttp(error=requests.ConnectionError('refused')),
+])
+def test_fetch_failure_returns_none_without_parsing(extractor, http):
+    extractor.http = http
+
+    assert extractor.extract_content(URL) is None
+    assert http.requested == [URL]
+    assert FakeArticle.instances == []
@@ -0,0 +1,285 @@
+import socket
+import threading
+import time
+import types
+import pytest
+import requests
+import urllib3.util.connection
+import urllib3.util.retry
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from requests.adapters import HTTPAdapter
+from web_search import http_client
+from web_search.http_client import CircuitOpenError, PooledHttpClient
+
+URL = 'http://flaky.example/page'
+OTHER_URL = 'http://ok.example/page'
+REDIRECT_URL = 'http://moved.example/page'
+
+
+class ScriptedTransport:
+    """Stands in for HTTPAdapter.send, replaying status codes, redirects or exceptions"""
+
+    def __init__(self):
+        self.outcomes = []
+        self.hosts = []
+
+    def send(self, request, **kwargs):
+        self.hosts.append(request.url.split('/')[2])
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = requests.Response()
+        if isinstance(outcome, tuple):
+            outcome, response.headers['Location'] = outcome
+        response.status_code = outcome
+        response.url = request.url
+        response.request = request
+        response._content = b''
+        response._content_consumed = True
+        return response
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler whose behaviour per request comes from server.script"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.hits += 1
+        action = self.server.script.pop(0) if self.server.script else 200
+        if action in ('drop', 'stall'):
+            if action == 'stall':
+                time.sleep(0.5)
+            # Close the socket without answering, like a server expiring an idle keep-alive
+            self.close_connection = True
+            return
+        self.send_response(action)
+        if action == 503:
+            self.send_header('Retry-After', '3600')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LocalHandler)
+    server.daemon_threads = True
+    server.hits = 0
+    server.script = []
+    server.url = f'http://127.0.0.1:{server.server_address[1]}/page'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record urllib3's retry backoff sleeps instead of waiting"""
+    recorded = []
+    monkeypatch.setattr(urllib3.util.retry, 'time', types.SimpleNamespace(sleep=recorded.append, time=time.time))
+    return recorded
+
+
+@pytest.fixture
+def closed_port_url():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f'http://127.0.0.1:{port}/page'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(http_client.time, 'monotonic', fake)
+    return fake
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    scripted = ScriptedTransport()
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda adapter, request, **kwargs: scripted.send(request))
+    return scripted
+
+
+@pytest.fixture
+def make_client(config):
+    def make(threshold=2, cooldown=60, **overrides):
+        config.update(overrides)
+        config['HTTP_CIRCUIT_FAILURE_THRESHOLD'] = threshold
+        config['HTTP_CIRCUIT_COOLDOWN'] = cooldown
+        return PooledHttpClient(config)
+    return make
+
+
+def test_circuit_opens_after_threshold(clock, transport, make_client):
+    client = make_client()
+    transport.outcomes = [requests.ConnectionError(), 503]
+
+    with pytest.raises(requests.ConnectionError):
+        client.get(URL)
+    assert not client.is_open(URL)
+    assert client.get(URL).status_code == 503
+    assert client.is_open(URL)
+
+    with pytest.raises(CircuitOpenError):
+        client.get(URL)
+    assert len(transport.hosts) == 2
+
+
+def test_circuit_is_per_host(clock, transport, make_client):
+    client = make_client()
+    transport.outcomes = [503, 503, 200]
+
+    client.get(URL)
+    client.get(URL)
+    assert client.is_open(URL)
+    assert not client.is_open(OTHER_URL)
+    assert client.get(OTHER_URL).status_code == 200
+
+
+def test_client_errors_do_not_count_as_failures(clock, transport, make_client):
+    client = make_client()
+    transport.outcomes = [404, 404, 404]
+
+    for _ in range(3):
+        client.get(URL)
+    assert not client.is_open(URL)
+
+
+def test_half_open_allows_one_request_with_one_strike_left(clock, transport, make_client):
+    client = make_client(threshold=2, cooldown=60)
+    transport.outcomes = [503, 503, 503]
+    client.get(URL)
+    client.get(URL)
+
+    clock.now += 59
+    with pytest.raises(CircuitOpenError):
+        client.get(URL)
+
+    clock.now += 1
+    assert not client.is_open(URL)
+    assert client.get(URL).status_code == 503
+    # A single failure after cooldown reopens the circuit
+    assert client.is_open(URL)
+    with pytest.raises(CircuitOpenError):
+        client.get(URL)
+    assert len(transport.hosts) == 3
+
+
+def test_success_resets_failures(clock, transport, make_client):
+    client = make_client(threshold=2)
+    transport.outcomes = [503, 200, 503, 200]
+
+    client.get(URL)
+    client.get(URL)
+    client.get(URL)
+    assert not client.is_open(URL)
+    assert client.get(URL).status_code == 200
+
+
+def test_success_after_cooldown_closes_circuit(clock, transport, make_client):
+    client = make_client(threshold=2, cooldown=60)
+    transport.outcomes = [503, 503, 200, 503]
+    client.get(URL)
+    client.get(URL)
+
+    clock.now += 60
+    assert client.get(URL).status_code == 200
+    # Failure count was cleared, so one more failure does not reopen
+    client.get(URL)
+    assert not client.is_open(URL)
+
+
+def test_redirect_target_failures_are_charged_to_target(clock, transport, make_client):
+    client = make_client(threshold=2)
+    transport.outcomes = [(302, REDIRECT_URL), 503, (302, REDIRECT_URL), requests.ConnectionError()]
+
+    assert client.get(URL).status_code == 503
+    with pytest.raises(requests.ConnectionError):
+        client.get(URL)
+    assert transport.hosts == ['flaky.example', 'moved.example'] * 2
+    assert client.is_open(REDIRECT_URL)
+    assert not client.is_open(URL)
+
+
+def test_redirect_to_open_host_is_short_circuited(clock, transport, make_client):
+    client = make_client(threshold=1)
+    transport.outcomes = [503, (302, REDIRECT_URL)]
+    client.get(REDIRECT_URL)
+
+    with pytest.raises(CircuitOpenError):
+        client.get(URL)
+    assert transport.hosts == ['moved.example', 'flaky.example']
+
+
+def test_connect_failures_are_retried_with_jittered_backoff(closed_port_url, sleeps, monkeypatch, config, make_client):
+    connects = []
+    create_connection = urllib3.util.connection.create_connection
+
+    def counting_create_connection(*args, **kwargs):
+        connects.append(args[0])
+        return create_connection(*args, **kwargs)
+
+    monkeypatch.setattr(urllib3.util.connection, 'create_connection', counting_create_connection)
+    client = make_client()
+
+    with pytest.raises(requests.ConnectionError):
+        client.get(closed_port_url)
+    assert len(connects) == 1 + config['HTTP_MAX_RETRIES']
+    # First retry is immediate, the second backs off factor * 2 plus jitter
+    assert len(sleeps) == 1
+    backoff = config['HTTP_BACKOFF_FACTOR'] * 2
+    assert backoff <= sleeps[0] <= backoff + config['HTTP_BACKOFF_JITTER']
+
+
+def test_status_errors_are_not_retried_by_default(local_server, sleeps, make_client):
+    client = make_client()
+    local_server.script = [503]
+
+    assert client.get(local_server.url).status_code == 503
+    assert local_server.hits == 1
+
+
+def test_status_retries_ignore_retry_after(local_server, sleeps, make_client):
+    client = make_client(HTTP_MAX_STATUS_RETRIES=1)
+    local_server.script = [503, 200]
+
+    assert client.get(local_server.url).status_code == 200
+    assert local_server.hits == 2
+    # The 503 asked for Retry-After: 3600; only the (zero) first backoff applies
+    assert sleeps == []
+
+
+def test_read_timeouts_are_not_retried_by_default(local_server, sleeps, make_client):
+    client = make_client(REQUEST_TIMEOUT=0.1)
+    local_server.script = ['stall']
+
+    with pytest.raises(requests.ConnectionError):
+        client.get(local_server.url)
+    assert local_server.hits == 1
+
+
+def test_dropped_keepalive_connection_is_resent(local_server, make_client):
+    client = make_client()
+    local_server.script = [200, 'drop', 200]
+
+    assert client.get(local_server.url).status_code == 200
+    # The second request reuses the pooled socket, which the server closes unanswered
+    assert client.get(local_server.url).status_code == 200
+    assert local_server.hits == 3
+    assert client._failures == {}
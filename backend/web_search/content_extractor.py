@@ -1,26 +1,35 @@
-import requests
 from bs4 import BeautifulSoup
 from newspaper import Article
 import re
 from urllib.parse import urlparse
 import tldextract
 from typing import Dict, Optional
+from web_search.http_client import PooledHttpClient
 
 class WebContentExtractor:
     def __init__(self, config):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.http = PooledHttpClient(config)
     
     def extract_content(self, url: str) -> Optional[Dict]:
         """Extract main content from a web page using newspaper or BeautifulSoup fallback"""
         try:
+            # Skip hosts that keep failing until their cooldown ends
+            if self.http.is_open(url):
+                return None
+
+            # Fetch once through the shared pool; both extractors decode the same raw bytes
+            try:
+                response = self.http.get(url)
+                response.raise_for_status()
+            except Exception as fetch_error:
+                print(f"Fetching failed for {url}: {fetch_error}")
+                return None
+            
             # First try with newspaper (better for article extraction)
             try:
                 article = Article(url)
-                article.download()
+                article.download(input_html=response.content)
                 article.parse()
                 
                 if article.text and len(article.text) > 100:
@@ -38,9 +47,6 @@ class WebContentExtractor:
             
             # Fallback to BeautifulSoup
             try:
-                response = self.session.get(url, timeout=self.config['REQUEST_TIMEOUT'])
-                response.raise_for_status()
-                
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
                 # Remove script, style, and nav elements
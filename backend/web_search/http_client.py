@@ -0,0 +1,139 @@
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.exceptions import MaxRetryError, ProtocolError
+from urllib3.util.retry import Retry
+from typing import Dict
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when a host has failed too often and is temporarily skipped"""
+
+
+def _is_dropped_connection(error: requests.ConnectionError) -> bool:
+    """Check whether the server closed the socket before answering (e.g. a stale keep-alive)"""
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, ProtocolError)
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter that applies the client's circuit breaker to every hop, redirects included"""
+
+    def __init__(self, client, **kwargs):
+        self.client = client
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).netloc.lower()
+        self.client._check_circuit(host)
+        try:
+            response = self._send_resending_dropped(request, **kwargs)
+        except requests.RequestException:
+            self.client._record_failure(host)
+            raise
+
+        if response.status_code >= 500:
+            self.client._record_failure(host)
+        else:
+            self.client._record_success(host)
+        return response
+
+    def _send_resending_dropped(self, request, **kwargs):
+        """Resend an idempotent request once if its connection was dropped"""
+        try:
+            return super().send(request, **kwargs)
+        except requests.ConnectionError as error:
+            if request.method not in ('GET', 'HEAD') or not _is_dropped_connection(error):
+                raise
+        # urllib3 has already discarded the dead socket, so this goes out on another connection
+        return super().send(request, **kwargs)
+
+
+class PooledHttpClient:
+    """Shared pooled HTTP client with retries, redirect limits and per-host circuit breaking"""
+
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    def __init__(self, config):
+        self.config = config
+        self.timeout = (config['HTTP_CONNECT_TIMEOUT'], config['REQUEST_TIMEOUT'])
+        self.failure_threshold = config['HTTP_CIRCUIT_FAILURE_THRESHOLD']
+        self.cooldown = config['HTTP_CIRCUIT_COOLDOWN']
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        self.session.max_redirects = config['HTTP_MAX_REDIRECTS']
+
+        retry = Retry(
+            total=config['HTTP_MAX_RETRIES'],
+            connect=config['HTTP_MAX_RETRIES'],
+            # Read and status retries re-send after the server accepted the request,
+            # so each one can cost a full read timeout
+            read=config['HTTP_MAX_READ_RETRIES'],
+            status=config['HTTP_MAX_STATUS_RETRIES'],
+            backoff_factor=config['HTTP_BACKOFF_FACTOR'],
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            backoff_jitter=config['HTTP_BACKOFF_JITTER'],
+            # Retry-After is unbounded and would bypass the latency budget below
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        # pool_connections = number of host pools kept, pool_maxsize = sockets kept per host
+        adapter = _PooledAdapter(
+            self,
+            pool_connections=config['HTTP_POOL_CONNECTIONS'],
+            pool_maxsize=config['HTTP_POOL_MAXSIZE'],
+            max_retries=retry,
+            pool_block=False,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL through the shared pool, honouring each host's circuit state"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def is_open(self, url: str) -> bool:
+        """Check whether requests to the URL's host are currently short-circuited"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            return self._open_until.get(host, 0) > time.monotonic()
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+    def _check_circuit(self, host: str):
+        with self._lock:
+            open_until = self._open_until.get(host)
+            if open_until is None:
+                return
+            if open_until > time.monotonic():
+                raise CircuitOpenError(f"Circuit open for {host}, skipping request")
+            # Cooldown elapsed: let one request through (half-open) with a single strike left
+            del self._open_until[host]
+            self._failures[host] = self.failure_threshold - 1
+
+    def _record_failure(self, host: str):
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold:
+                self._open_until[host] = time.monotonic() + self.cooldown
+
+    def _record_success(self, host: str):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._open_until.pop(host, None)